@@ -1,23 +1,46 @@
 import os
+from multiprocessing import Pool
 
-import scipy.spatial
-from numpy import arange, array
+from numpy import arange
 from pygran import analysis
 
-Gran = analysis.System(Particles="traj.dump")
-
-# Go to last frame
-Gran.goto(-1)
-
-# Create a new class containing particles between  z=0 and z=1e-3
-Particles = Gran.Particles
-Particles = Particles[Particles.z <= 1e-3 & Particles.z >= 0]
-
 # Set image resolution and size
 resol = 1.24e-6  # microns/pixel
 size = (512, 512)
 
-for i, z in enumerate(arange(0, Particles.z.max() + resol, resol)):
+
+def loadParticles(parts):
+    """Pool initializer: shares the Particles to image with each worker process"""
+    global Particles
+    Particles = parts
+
+
+def writeSlice(args):
+    """Writes the image of a single slice of thickness 'resol' starting at height z"""
+    i, z = args
     zmin, zmax = z, z + resol
-    output = "output/poured{}.bmp".format(i)
-    analysis.imaging.slice(Particles, zmin, zmax, "z", size, resol, output)
+    output = os.path.join("output", "poured{}.bmp".format(i))
+    analysis.imaging.slice(
+        Particles, zmin, zmax, "z", resol=resol, size=size, output=output
+    )
+
+
+if __name__ == "__main__":
+
+    Gran = analysis.System(Particles="traj.dump")
+
+    # Go to last frame
+    Gran.goto(-1)
+
+    # Create a new class containing particles between  z=0 and z=1e-3
+    Particles = Gran.Particles
+    Particles = Particles[(Particles.z <= 1e-3) & (Particles.z >= 0)]
+
+    os.makedirs("output", exist_ok=True)
+
+    # Slices are independent of each other, so write them concurrently
+    slices = list(enumerate(arange(0, Particles.z.max() + resol, resol)))
+
+    with Pool(initializer=loadParticles, initargs=(Particles,)) as pool:
+        chunksize = max(1, len(slices) // (4 * os.cpu_count()))
+        pool.map(writeSlice, slices, chunksize=chunksize)
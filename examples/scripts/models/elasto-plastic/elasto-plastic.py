@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib as mpl
 import matplotlib.pylab as plt
 from numpy import arange, array, fabs, sqrt
@@ -5,33 +7,38 @@ from pygran import simulation as sim
 from pygran.params import cohesionless
 
 
-def run():
-
-    # Setup matplotlib params
-    mpl.rc("text", usetex=True)
-    plt.rcParams.update({"font.size": 18})
+def collide(yieldPress):
+    """Integrates a single collision for a given yield pressure and returns
+    the (COR, yield velocity) pair, both normalized by the impact velocity"""
 
     cModel = sim.models.ThorntonNing
 
-    COR, yieldVel = [], []
+    # Set particle radius to 100 microns
+    material = dict(cohesionless, radius=1e-4, yieldPress=yieldPress)
+    model = cModel(material=material)
 
-    # Create a yield pressure array to study
-    pressure = arange(1, 6, 0.1) * cohesionless["youngsModulus"] * 0.01
+    time, disp, force = model.displacement()
 
-    # Set particle radius to 100 microns
-    cohesionless["radius"] = 1e-4
+    deltav = disp[:, 1]
 
-    for yieldPress in pressure:
+    return (
+        fabs(deltav[-1] / material["characteristicVelocity"]),
+        model.yieldVel / material["characteristicVelocity"],
+    )
 
-        cohesionless["yieldPress"] = yieldPress
-        model = cModel(material=cohesionless)
 
-        time, disp, force = model.displacement()
+def run():
 
-        deltav = disp[:, 1]
+    # Setup matplotlib params
+    mpl.rc("text", usetex=True)
+    plt.rcParams.update({"font.size": 18})
+
+    # Create a yield pressure array to study
+    pressure = arange(1, 6, 0.1) * cohesionless["youngsModulus"] * 0.01
 
-        COR.append(fabs(deltav[-1] / cohesionless["characteristicVelocity"]))
-        yieldVel.append(model.yieldVel / cohesionless["characteristicVelocity"])
+    # Collisions are independent of each other, so integrate them concurrently
+    with ProcessPoolExecutor() as executor:
+        COR, yieldVel = zip(*executor.map(collide, pressure))
 
     ratio = array(yieldVel)
     ratio[ratio > 1] = 1
@@ -24,9 +24,22 @@
  """
 
 import matplotlib.pylab as plt
-from numpy import array, pi, sqrt
+from numpy import (
+    arccos,
+    array,
+    asarray,
+    cbrt,
+    clip,
+    cos,
+    count_nonzero,
+    errstate,
+    pi,
+    sqrt,
+    unique,
+    where,
+)
 from pygran import analysis
-from pygran.params import stearicAcid
+from pygran.params import Material, stearicAcid
 from scipy import optimize
 
 stearicAcid["cohesionEnergyDensity"] = 0.033
@@ -48,10 +61,8 @@ def checkYieldNum(reff, **material):
 
     # Extract material params from supplied database
     py = material["yieldPress"]
-    poiss = material["poissonsRatio"]
     gamma = material["cohesionEnergyDensity"]
-    Young = material["youngsModulus"]
-    YoungEff = Young * 0.5 / (1.0 - poiss)
+    YoungEff = Material(material).effectiveModulus
 
     def eq(x, *args):
 
@@ -70,38 +81,49 @@ def checkYieldNum(reff, **material):
 
 
 def checkYield(reff, **material):
-    """Solves symbolically the cubic equation x^3 - b*x - c = 0 for yielding contact_radius = sqrt(x)
+    """Solves analytically the cubic equation x^3 - b*x - c = 0 for yielding contact_radius = sqrt(x)
     based on Thornton's elasto-plastic cohesive model:
 
     b = py * pi * reff / (2 * YoungEff)
     c = reff * sqrt(gamma * pi / (2 * YoungEff))
 
-    @reff: effective radius
+    Since b, c >= 0, the cubic has a single positive root. It is computed with Cardano's formula
+    when the discriminant is positive and with the trigonometric form otherwise. The function
+    is vectorized over 'reff'.
+
+    @reff: effective radius (float or array)
     @py: yielding pressure
     @YoungEff: Young's effective modulus
     @gamma: cohesion energy density
     """
     # Extract material params from supplied database
     py = material["yieldPress"]
-    poiss = material["poissonsRatio"]
     gamma = material["cohesionEnergyDensity"]
-    Young = material["youngsModulus"]
-    YoungEff = Young * 0.5 / (1.0 - poiss)
+    YoungEff = Material(material).effectiveModulus
+
+    reff = asarray(reff, dtype=float)
 
     # Compute the 'b' and 'c' coefficients
     b = py * pi * reff / (2.0 * YoungEff)
     c = reff * sqrt(gamma * pi / (2.0 * YoungEff))
 
-    # Solve the algebraic equation symbolically
-    frac = 0.333333333333333333333333333333333333333333333333333
-    common = (9 * c + sqrt(3 * (27 * c**2 - 4 * b**3))) ** frac
+    # Solve the algebraic equation analytically
+    disc = c**2 / 4.0 - b**3 / 27.0
+    one_root = disc >= 0
+
+    with errstate(divide="ignore", invalid="ignore"):
+        sq = sqrt(where(one_root, disc, 0))
+        x_cardano = cbrt(c / 2.0 + sq) + cbrt(c / 2.0 - sq)
+
+        phi = arccos(clip(1.5 * c / b * sqrt(3.0 / b), -1, 1))
+        x_trig = 2.0 * sqrt(b / 3.0) * cos(phi / 3.0)
 
-    x = b * (2.0 / 3.0) ** frac / common + common / (18**frac)
+    x = where(one_root, x_cardano, x_trig)
 
     # Compute contact yield radius
     ay = x * x
 
-    # Return yielding contact radius
+    # Return yielding overlap
     return ay * ay / reff - sqrt(2.0 * pi * gamma * ay / YoungEff)
 
 
@@ -115,25 +137,16 @@ for ts in System:
     # Extract radii of all particles
     radii = System.Particles.radius
 
-    ny = 0
-
-    for contact, index in enumerate(indices):
-
-        # Get the two particle (in contact) indices
-        i, j = index
-
-        # Compute reff
-        reff = (radii[i] * radii[j]) / (radii[i] + radii[j])
-
-        # Get overlap
-        delta = overlaps[contact]
+    # Get the two particle (in contact) indices and compute reff for all contacts at once
+    i, j = indices.astype(int).T
+    reff = (radii[i] * radii[j]) / (radii[i] + radii[j])
 
-        # Compute yield contact radius symbolically and numerically
-        # ay = checkYield(reff, **stearicAcid)
-        deltay = checkYieldNum(reff, **stearicAcid)
+    # Contacts with the same effective radius share the same yield overlap, so
+    # compute it only once per distinct reff
+    reff_unique, inverse = unique(reff, return_inverse=True)
+    deltay = checkYield(reff_unique, **stearicAcid)[inverse]
 
-        if delta >= deltay:
-            ny += 1
+    ny = count_nonzero(overlaps >= deltay)
 
     data.append([ts, ny])
 
@@ -26,20 +26,70 @@
   and LICENSE files.
 """
 
-from pygran_sim.tools import configure
+import importlib
+import os
 
 from . import params
 
-# Handle versioneer
-from ._version import get_versions
+# Legacy submodules, configure, and version info are resolved on first access
+# (PEP 562) so that a bare 'import pygran' does not pull in scipy, VTK, mpi4py,
+# or the LIGGGHTS loader. Each entry maps an attribute to (module, name), where a
+# name of None refers to the module itself.
+_lazy = {
+    "analysis": (".analysis", None),
+    "simulation": (".simulation", None),
+    "configure": ("pygran_sim.tools", "configure"),
+    "sweep": ("pygran.tools.sweep", "sweep"),
+}
 
-# Legacy submodules
-from .analysis import analysis
-from .simulation import simulation
+__all__ = ["params", "simulation", "analysis", "sweep", "__version__"]
 
-versions = get_versions()
-__version__ = versions["version"]
-__git_revision__ = versions["full-revisionid"]
-del get_versions, versions
 
-__all__ = ["params", "simulation", "analysis", "__version__"]
+def _versions():
+    """Returns the version baked in at build/install time. Querying versioneer (which
+    may shell out to git) must be explicitly requested via PYGRAN_VERSION_FROM_VCS=1."""
+
+    if os.environ.get("PYGRAN_VERSION_FROM_VCS") != "1":
+        try:
+            from ._static_version import full_revisionid, version
+        except ImportError:
+            version, full_revisionid = "0+unknown", None
+
+        return {"__version__": version, "__git_revision__": full_revisionid}
+
+    # Handle versioneer
+    from ._version import get_versions
+
+    versions = get_versions()
+    return {
+        "__version__": versions["version"],
+        "__git_revision__": versions["full-revisionid"],
+    }
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module, attr = _lazy[name]
+        value = importlib.import_module(module, __name__)
+
+        if attr is not None:
+            value = getattr(value, attr)
+        elif value.__name__ == f"{__name__}.{name}":
+            # The legacy shims replace themselves with the pkg they wrap, unless it is uninstalled.
+            # Then the attribute is None, but 'import pygran.analysis' still binds the shim.
+            value = None
+
+        # Importing a submodule binds it to this package, so override it here
+        globals()[name] = value
+        return value
+
+    if name in ("__version__", "__git_revision__"):
+        versions = _versions()
+        globals().update(versions)
+        return versions[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy) | {"__version__", "__git_revision__"})
@@ -25,6 +25,7 @@
   If not, see http://www.gnu.org/licenses . See also top-level README
   and LICENSE files.
 """
+import sys
 import warnings
 
 try:
@@ -33,3 +34,8 @@ try:
 except Exception:
     analysis = None
     warnings.warn("pygran_analysis uninstalled. Solve by: pip install pygran_analysis.")
+else:
+    # Make 'import pygran.analysis' resolve to the pygran_analysis pkg itself, not to this module.
+    # If the pkg is uninstalled, 'import pygran.analysis' binds this module (whose
+    # 'analysis' is None), while 'from pygran import analysis' gives None.
+    sys.modules[__name__] = analysis
@@ -26,81 +26,419 @@
   and LICENSE files.
 """
 
-glass = {
-    "youngsModulus": 63e9,
-    "poissonsRatio": 0.24,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "cohesionEnergyDensity": 0.05,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 62e9,
-    "characteristicVelocity": 0.1,
-    "density": 2500.0,
-}
-
-organic = {
-    "youngsModulus": 1e7,
-    "poissonsRatio": 0.25,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "cohesionEnergyDensity": 0.0,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 2.2e6,
-    "characteristicVelocity": 0.1,
-    "density": 1000.0,
-}
-
-stearicAcid = {
-    "youngsModulus": 4.15e7,
-    "poissonsRatio": 0.25,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "cohesionEnergyDensity": 0.033,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 2.2e6,
-    "characteristicVelocity": 0.1,
-    "density": 997.164,
-}
-
-cohesionless = {
-    "youngsModulus": 1e7,
-    "poissonsRatio": 0.25,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 2.2e6,
-    "characteristicVelocity": 0.1,
-    "density": 1000.0,
-}
-
-cohesive = {
-    "youngsModulus": 1e7,
-    "poissonsRatio": 0.25,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "cohesionEnergyDensity": 2e5,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 2.2e6,
-    "characteristicVelocity": 0.1,
-    "density": 1000.0,
-}
-
-steel = {
-    "youngsModulus": 2e11,
-    "poissonsRatio": 0.3,
-    "coefficientFriction": 0.5,
-    "coefficientRollingFriction": 0.0,
-    "cohesionEnergyDensity": 0.0,
-    "coefficientRestitution": 0.9,
-    "coefficientRollingViscousDamping": 0.1,
-    "yieldPress": 2e10,
-    "characteristicVelocity": 0.1,
-    "density": 8050,
-}
-
-__all__ = ["glass", "stearicAcid", "cohesionless", "cohesive", "steel", "organic"]
+import functools
+import math
+
+# Pair properties are mixed with the geometric mean, as done by the LIGGGHTS engine for peratomtypepair properties
+_PAIR_PROPERTIES = (
+    "coefficientFriction",
+    "coefficientRollingFriction",
+    "coefficientRestitution",
+    "coefficientRollingViscousDamping",
+    "cohesionEnergyDensity",
+)
+
+
+def _cached(func):
+    """Turns a method into a read-only property whose value is stored in the Material cache"""
+
+    @functools.wraps(func)
+    def wrapper(self):
+        try:
+            return self._cache[func.__name__]
+        except KeyError:
+            value = self._cache[func.__name__] = func(self)
+            return value
+
+    return property(wrapper)
+
+
+class Material(dict):
+    """A dictionary of material properties that caches derived contact quantities. Material is a
+    dict subclass so it can be used wherever a plain material dict is expected (e.g. the 'material'
+    of a species in simulation.DEM or of a contact model). Any mutation invalidates the cache.
+
+    Derived quantities assume a contact between two particles of the same material.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = {}
+
+    def __setitem__(self, key, value):
+        self._cache.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._cache.clear()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({super().__repr__()})"
+
+    def update(self, *args, **kwargs):
+        self._cache.clear()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._cache.clear()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._cache.clear()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._cache.clear()
+        return super().popitem()
+
+    def clear(self):
+        self._cache.clear()
+        super().clear()
+
+    def copy(self):
+        return self.__class__(self)
+
+    @_cached
+    def effectiveModulus(self):
+        """Effective Young's modulus E / (2 (1 - poissonsRatio^2)) of a contact"""
+        return self["youngsModulus"] * 0.5 / (1.0 - self["poissonsRatio"] ** 2)
+
+    @_cached
+    def shearModulus(self):
+        """Shear modulus E / (2 (1 + poissonsRatio))"""
+        return self["youngsModulus"] * 0.5 / (1.0 + self["poissonsRatio"])
+
+    @_cached
+    def yieldVel(self):
+        """Minimum impact velocity for plastic deformation based on :cite:`thornton1998theoretical`"""
+        return 1.56 * math.sqrt(
+            self["yieldPress"] ** 5 / (self.effectiveModulus**4 * self["density"])
+        )
+
+    @_cached
+    def _rayleighFactor(self):
+        poiss = self["poissonsRatio"]
+        return (
+            math.pi
+            * math.sqrt(self["density"] / self.shearModulus)
+            / (0.1631 * poiss + 0.8766)
+        )
+
+    def rayleighTime(self, radius):
+        """Computes the Rayleigh time, i.e. the time it takes a shear wave to propagate through a particle
+
+        :param radius: particle radius
+        :type radius: float or numpy array
+
+        :return: Rayleigh time (same shape as radius)
+        :rtype: float or numpy array
+        """
+        return self._rayleighFactor * radius
+
+
+def effectiveRadius(radius1, radius2):
+    """Computes the effective (reduced) radius :math:`R_1 R_2 / (R_1 + R_2)` of two particles
+
+    :param radius1: radius of the 1st particle
+    :type radius1: float or numpy array
+
+    :param radius2: radius of the 2nd particle
+    :type radius2: float or numpy array
+    """
+    return radius1 * radius2 / (radius1 + radius2)
+
+
+def pairProperties(materials, radii=None):
+    """Computes tables of pair properties for a multi-component system, where entry (i, j) is
+    the property of a contact between components i and j
+
+    :param materials: materials of each component
+    :type materials: sequence of dict
+
+    :param radii: particle radius of each component (optional)
+    :type radii: sequence of float
+
+    :return: a dict mapping each property to a 2D array. The dict contains the effective Young's
+        modulus ('youngsModulus'), the effective radius ('radius') if radii is supplied, and the
+        geometric mean of any pair coefficient (friction, restitution, etc.) defined for all components.
+    :rtype: dict
+    """
+    # numpy is imported here to keep 'import pygran' (which imports params) lightweight
+    import numpy as np
+
+    youngs = np.array([mat["youngsModulus"] for mat in materials], dtype=float)
+    poiss = np.array([mat["poissonsRatio"] for mat in materials], dtype=float)
+    compliance = (1.0 - poiss**2) / youngs
+
+    props = {"youngsModulus": 1.0 / (compliance[:, None] + compliance[None, :])}
+
+    if radii is not None:
+        radii = np.asarray(radii, dtype=float)
+        props["radius"] = effectiveRadius(radii[:, None], radii[None, :])
+
+    for prop in _PAIR_PROPERTIES:
+        if all(prop in mat for mat in materials):
+            values = np.array([mat[prop] for mat in materials], dtype=float)
+            props[prop] = np.sqrt(values[:, None] * values[None, :])
+
+    return props
+
+
+def _radii(radius, nquantiles=21):
+    """Expands a species radius definition (see timestep) into an array of radii covering its
+    size distribution. Normal and lognormal distributions are represented by quantiles spanning
+    3 standard deviations on each side of the mean (of the log for lognormal)."""
+    import numpy as np
+
+    if not isinstance(radius, tuple):
+        radius = ("constant", radius)
+
+    style = radius[0]
+
+    # Number of fields per style; the trailing sample count of normal/lognormal is optional
+    nfields = {"constant": (2,), "poly": (3,), "normal": (3, 4), "lognormal": (3, 4)}
+
+    if style in nfields and len(radius) not in nfields[style]:
+        raise ValueError(
+            f"Radius {radius} must have {' or '.join(map(str, nfields[style]))} fields"
+        )
+
+    zscore = np.linspace(-3, 3, nquantiles)
+
+    if style == "constant":
+        radii = np.array([radius[1]], dtype=float)
+    elif style == "poly":
+        radii = np.asarray(radius[1], dtype=float)
+    elif style == "normal":
+        mean, std = radius[1], radius[1] * radius[2]
+        radii = mean + std * zscore
+    elif style == "lognormal":
+        # Parameters of the underlying normal distribution with the same mean and variance
+        std = np.sqrt(np.log(1.0 + radius[2] ** 2))
+        mean = np.log(radius[1]) - std**2 / 2.0
+        radii = np.exp(mean + std * zscore)
+    else:
+        raise ValueError(f"Unsupported radius distribution: {style}")
+
+    return radii[radii > 0]
+
+
+def timestep(species, velocity=None, rayleighFraction=0.2, collisionSteps=50):
+    """Estimates the largest stable timestep for a set of species (as passed to simulation.DEM).
+    The timestep is the smallest of:
+
+    - a fraction of the Rayleigh time of the smallest particle of each species
+    - the Hertzian collision time divided by the number of steps required to resolve a collision,
+      evaluated for all pairs of radii in the size distributions of all species
+
+    The Hertzian limit depends on the impact velocity, so it should be re-evaluated per stage
+    (e.g. fast insertion vs. settling).
+
+    :param species: species definitions, each a dict with 'material' and 'radius' keys. As for
+        simulation.DEM with nSim > 1, 'material' (and 'radius') may be a list with one entry
+        per concurrent simulation. A radius is either a number or a tuple, following the
+        conventions of the LIGGGHTS engine of simulation.DEM:
+
+        - ('constant', r)
+        - ('poly', radii, weights), where only the radii are used
+        - ('normal', mean, cv, npts): normal distribution of standard deviation mean * cv. The
+          sample count npts is optional and ignored, since all quantiles of the distribution
+          are used instead.
+        - ('lognormal', mean, cv, npts): lognormal distribution of the given mean and coefficient
+          of variation cv. The engine derives the log standard deviation from cv * log(mean),
+          which depends on the length unit, so cv is read here as the coefficient of variation.
+          As for normal, npts is optional and ignored.
+    :type species: sequence of dict
+
+    :param velocity: characteristic impact velocity; defaults to the largest 'characteristicVelocity'
+        of all materials. If neither is available, only the Rayleigh limit is used.
+    :type velocity: float
+
+    :param rayleighFraction: fraction of the Rayleigh time used as an upper bound on the timestep
+    :type rayleighFraction: float
+
+    :param collisionSteps: minimum number of steps per Hertzian collision
+    :type collisionSteps: int
+
+    :return: the suggested timestep, or a list of timesteps (one per simulation) if the species
+        define lists of materials
+    :rtype: float or list
+    """
+    import numpy as np
+
+    species = list(species)
+
+    if not species:
+        raise ValueError("At least one species is required to estimate a timestep")
+
+    nsim = max(
+        (len(ss["material"]) if isinstance(ss["material"], list) else 0 for ss in species),
+        default=0,
+    )
+
+    if nsim:
+        # Estimate the timestep of each concurrent simulation separately
+        def member(value, i):
+            return value[i] if isinstance(value, list) else value
+
+        members = [
+            [
+                dict(ss, material=member(ss["material"], i), radius=member(ss["radius"], i))
+                for ss in species
+            ]
+            for i in range(nsim)
+        ]
+
+        return [
+            timestep(ss, velocity, rayleighFraction, collisionSteps) for ss in members
+        ]
+
+    for ss in species:
+        if not isinstance(ss["material"], dict):
+            raise TypeError(
+                f"Species material must be a dict or a list of dicts, not {type(ss['material'])}"
+            )
+
+    materials = [ss["material"] for ss in species]
+    materials = [mat if isinstance(mat, Material) else Material(mat) for mat in materials]
+    radii = [_radii(ss["radius"]) for ss in species]
+
+    dt = min(
+        rayleighFraction * mat.rayleighTime(rad.min())
+        for mat, rad in zip(materials, radii)
+    )
+
+    if velocity is None:
+        velocities = [mat.get("characteristicVelocity", 0) for mat in materials]
+        velocity = max(velocities)
+
+    if velocity:
+        youngs = pairProperties(materials)["youngsModulus"]
+        masses = [
+            4.0 / 3.0 * np.pi * mat["density"] * rad**3
+            for mat, rad in zip(materials, radii)
+        ]
+
+        for i in range(len(species)):
+            for j in range(i, len(species)):
+                # Evaluate all radius pairs of species i and j at once
+                reff = effectiveRadius(radii[i][:, None], radii[j][None, :])
+                meff = effectiveRadius(masses[i][:, None], masses[j][None, :])
+
+                tcol = 2.87 * (meff**2 / (reff * youngs[i, j] ** 2 * velocity)) ** 0.2
+                dt = min(dt, tcol.min() / collisionSteps)
+
+    return float(dt)
+
+
+glass = Material(
+    {
+        "youngsModulus": 63e9,
+        "poissonsRatio": 0.24,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "cohesionEnergyDensity": 0.05,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 62e9,
+        "characteristicVelocity": 0.1,
+        "density": 2500.0,
+    }
+)
+
+organic = Material(
+    {
+        "youngsModulus": 1e7,
+        "poissonsRatio": 0.25,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "cohesionEnergyDensity": 0.0,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 2.2e6,
+        "characteristicVelocity": 0.1,
+        "density": 1000.0,
+    }
+)
+
+stearicAcid = Material(
+    {
+        "youngsModulus": 4.15e7,
+        "poissonsRatio": 0.25,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "cohesionEnergyDensity": 0.033,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 2.2e6,
+        "characteristicVelocity": 0.1,
+        "density": 997.164,
+    }
+)
+
+cohesionless = Material(
+    {
+        "youngsModulus": 1e7,
+        "poissonsRatio": 0.25,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 2.2e6,
+        "characteristicVelocity": 0.1,
+        "density": 1000.0,
+    }
+)
+
+cohesive = Material(
+    {
+        "youngsModulus": 1e7,
+        "poissonsRatio": 0.25,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "cohesionEnergyDensity": 2e5,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 2.2e6,
+        "characteristicVelocity": 0.1,
+        "density": 1000.0,
+    }
+)
+
+steel = Material(
+    {
+        "youngsModulus": 2e11,
+        "poissonsRatio": 0.3,
+        "coefficientFriction": 0.5,
+        "coefficientRollingFriction": 0.0,
+        "cohesionEnergyDensity": 0.0,
+        "coefficientRestitution": 0.9,
+        "coefficientRollingViscousDamping": 0.1,
+        "yieldPress": 2e10,
+        "characteristicVelocity": 0.1,
+        "density": 8050,
+    }
+)
+
+__all__ = [
+    "Material",
+    "effectiveRadius",
+    "pairProperties",
+    "timestep",
+    "glass",
+    "stearicAcid",
+    "cohesionless",
+    "cohesive",
+    "steel",
+    "organic",
+]
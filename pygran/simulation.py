@@ -25,6 +25,7 @@
   If not, see http://www.gnu.org/licenses . See also top-level README
   and LICENSE files.
 """
+import sys
 import warnings
 
 try:
@@ -35,3 +36,8 @@ except Exception:
     warnings.warn(
         "pygran_simulation uninstalled. Solve by: pip install pygran_simulation."
     )
+else:
+    # Make 'import pygran.simulation' resolve to the pygran_sim pkg itself, not to this module.
+    # If the pkg is uninstalled, 'import pygran.simulation' binds this module (whose
+    # 'simulation' is None), while 'from pygran import simulation' gives None.
+    sys.modules[__name__] = simulation
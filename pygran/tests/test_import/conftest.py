@@ -0,0 +1,15 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--import-benchmark",
+        action="store_true",
+        help="run wall-clock import-time benchmarks",
+    )
+
+
+@pytest.fixture
+def import_benchmark(request):
+    if not request.config.getoption("--import-benchmark", default=False):
+        pytest.skip("import-time benchmarks run only with --import-benchmark")
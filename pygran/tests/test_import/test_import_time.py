@@ -0,0 +1,52 @@
+import pytest
+
+from pygran.tools import import_profile
+
+
+def test_cold_run_fills_cache(tmp_path, monkeypatch):
+    # The cold run must write the bytecode cache used by warm runs, even in containers
+    # that disable bytecode writing
+    monkeypatch.setenv("PYTHONDONTWRITEBYTECODE", "1")
+    import_profile.profile("pygran.params", str(tmp_path))
+
+    assert list(tmp_path.rglob("*.pyc"))
+
+
+def test_import_failure():
+    assert import_profile.main(["--modules", "pygran.nonexistent", "--repeat", "1"]) == 1
+
+
+def test_dependencies(tmp_path, monkeypatch):
+    # Failed imports of optional dependencies are listed by '-X importtime' but not reported
+    (tmp_path / "pygran_analysis").mkdir()
+    (tmp_path / "pygran_analysis" / "__init__.py").write_text("raise ImportError\n")
+    (tmp_path / "probe.py").write_text(
+        "import numpy\ntry:\n    import pygran_analysis\nexcept ImportError:\n    pass\n"
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+    breakdown = import_profile.profile("probe")
+    assert "numpy" in breakdown
+    assert "pygran_analysis" not in breakdown
+
+
+def test_unavailable(tmp_path, monkeypatch):
+    # A legacy submodule whose wrapped pkg is missing imports, but is reported as unavailable
+    (tmp_path / "pygran_analysis").mkdir()
+    (tmp_path / "pygran_analysis" / "__init__.py").write_text("raise ImportError\n")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+    with pytest.raises(import_profile.Unavailable):
+        import_profile.profile("pygran.analysis")
+
+    args = ["--modules", "pygran.analysis", "--repeat", "1"]
+    assert import_profile.main(args) == 0
+    assert import_profile.main(args + ["--threshold", "pygran.analysis=1"]) == 1
+
+
+@pytest.mark.parametrize("module", sorted(import_profile.THRESHOLDS))
+def test_import_time(module, import_benchmark):
+    cold, warm = import_profile.benchmark(module, repeat=3)
+
+    assert cold["total"] > 0
+    assert warm["total"] <= import_profile.THRESHOLDS[module]
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+
+def test_lazy_import():
+    # Importing pygran in a fresh interpreter must not load any of the heavy deps
+    code = (
+        "import sys, pygran; "
+        "heavy = ('scipy', 'vtk', 'mpi4py', 'pygran_analysis', 'pygran_sim', 'pygran._version'); "
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert loaded == ""
+
+
+def test_lazy_attributes():
+    import pygran
+
+    assert "analysis" in dir(pygran)
+    assert isinstance(pygran.__version__, str)
+
+
+def test_submodule_import(tmp_path):
+    # All import forms of the legacy submodules must yield the wrapped pkg, not the shim
+    (tmp_path / "pygran_analysis").mkdir()
+    (tmp_path / "pygran_analysis" / "__init__.py").write_text("System = None\n")
+
+    code = (
+        "import pygran.analysis as mod, pygran; "
+        "from pygran import analysis; "
+        "print(mod.__name__, pygran.analysis.__name__, analysis.__name__)"
+    )
+    env = dict(os.environ, PYTHONPATH=str(tmp_path))
+    names = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.split()
+
+    assert names == ["pygran_analysis"] * 3
+
+    # Without the wrapped pkg, attribute access gives None (as before the lazy imports), but
+    # 'import pygran.analysis' can only bind a module, i.e. the shim, whose 'analysis' is None
+    (tmp_path / "pygran_analysis" / "__init__.py").write_text("raise ImportError\n")
+
+    code = "from pygran import analysis; print(analysis)"
+    printed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+    assert printed == "None"
+
+    code = "import pygran.analysis; print(pygran.analysis.__name__, pygran.analysis.analysis)"
+    printed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.split()
+    assert printed == ["pygran.analysis", "None"]
+
+
+def test_static_version():
+    # Resolving __version__ must not go through versioneer unless explicitly requested
+    code = "import sys, pygran; pygran.__version__; print('pygran._version' in sys.modules)"
+    env = {k: v for k, v in os.environ.items() if k != "PYGRAN_VERSION_FROM_VCS"}
+
+    probed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+    assert probed == "False"
+
+    env["PYGRAN_VERSION_FROM_VCS"] = "0"
+    probed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+    assert probed == "False"
+
+    env["PYGRAN_VERSION_FROM_VCS"] = "1"
+    probed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.strip()
+    assert probed == "True"
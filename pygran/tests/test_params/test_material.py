@@ -0,0 +1,97 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pygran import params
+
+
+def test_material_cache():
+    mat = params.organic.copy()
+    assert isinstance(mat, params.Material)
+
+    modulus = mat.effectiveModulus
+    assert modulus == pytest.approx(1e7 / (2 * (1 - 0.25**2)))
+
+    # Any mutation must invalidate the cached derived quantities
+    mat["youngsModulus"] = 2e7
+    assert mat.effectiveModulus == pytest.approx(2 * modulus)
+
+    mat.update(poissonsRatio=0.0)
+    assert mat.effectiveModulus == pytest.approx(1e7)
+
+    # Materials must still behave as plain dicts
+    assert dict(mat, radius=1e-4)["radius"] == 1e-4
+    assert pickle.loads(pickle.dumps(mat)) == mat
+
+
+def test_rayleigh_time():
+    radius = np.array([1e-4, 2e-4])
+    dt = params.steel.rayleighTime(radius)
+
+    assert dt.shape == radius.shape
+    assert dt[1] == pytest.approx(2 * dt[0])
+    assert params.steel.rayleighTime(1e-4) == pytest.approx(dt[0])
+
+
+def test_pair_properties():
+    props = params.pairProperties([params.glass, params.steel], radii=[1e-4, 2e-4])
+
+    assert props["youngsModulus"].shape == (2, 2)
+    assert props["youngsModulus"][0, 0] == pytest.approx(params.glass.effectiveModulus)
+    assert props["youngsModulus"][1, 1] == pytest.approx(params.steel.effectiveModulus)
+    assert np.allclose(props["youngsModulus"], props["youngsModulus"].T)
+    assert props["radius"][0, 1] == pytest.approx(params.effectiveRadius(1e-4, 2e-4))
+    assert props["cohesionEnergyDensity"][0, 1] == 0
+
+
+def test_timestep():
+    species = ({"material": params.glass, "radius": ("constant", 1e-4)},)
+    dt = params.timestep(species)
+
+    assert 0 < dt <= 0.2 * params.glass.rayleighTime(1e-4)
+
+    # Faster impacts and smaller particles require smaller timesteps
+    assert params.timestep(species, velocity=10) < dt
+
+    species += ({"material": params.glass, "radius": ("normal", 5e-5, 0.1, 100)},)
+    assert params.timestep(species) < dt
+
+
+@pytest.mark.parametrize("style", ["normal", "lognormal"])
+def test_timestep_units(style):
+    # The size distribution is defined by a relative spread, so it must not depend on the unit
+    radius = (style, 5e-5, 0.1, 100)
+    scaled = (style, 5e-2, 0.1, 100)
+
+    assert np.allclose(params._radii(radius) / 5e-5, params._radii(scaled) / 5e-2)
+    assert np.ptp(params._radii((style, 1.0, 0.1, 100))) > 0
+
+    # The Rayleigh limit (velocity=0) scales linearly with particle size
+    dt = params.timestep(({"material": params.glass, "radius": radius},), velocity=0)
+    dt_scaled = params.timestep(({"material": params.glass, "radius": scaled},), velocity=0)
+    assert dt_scaled == pytest.approx(1e3 * dt)
+
+
+def test_timestep_nsim():
+    species = ({"material": [params.glass, params.organic], "radius": ("constant", 2e-4)},)
+    dts = params.timestep(species)
+
+    assert len(dts) == 2
+    assert dts[0] == pytest.approx(params.timestep(({"material": params.glass, "radius": 2e-4},)))
+    assert dts[1] > dts[0]
+
+    with pytest.raises(TypeError):
+        params.timestep(({"material": (params.glass,), "radius": 2e-4},))
+
+
+def test_timestep_invalid():
+    with pytest.raises(ValueError, match="species"):
+        params.timestep(())
+
+    # Extra fields are rejected, except for the sample count of normal/lognormal
+    with pytest.raises(ValueError, match="fields"):
+        params.timestep(({"material": params.glass, "radius": ("constant", 2e-4, 1)},))
+
+    dt = params.timestep(({"material": params.glass, "radius": ("normal", 2e-4, 0.1)},))
+    assert dt == params.timestep(({"material": params.glass, "radius": ("normal", 2e-4, 0.1, 100)},))
@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+import pytest
+
+from pygran.tools import bvh, stl
+
+MESH = os.path.join(os.path.dirname(__file__), "..", "test_sim", "mesh")
+
+
+def brute(points, vertices, faces):
+    # Distances from every point to every triangle
+    npts, ntris = len(points), len(faces)
+    a, b, c = [np.tile(vertices[faces[:, i]], (npts, 1)) for i in range(3)]
+    xyz = np.repeat(points, ntris, axis=0)
+
+    dist = np.linalg.norm(xyz - bvh._closest(xyz, a, b, c), axis=1).reshape(npts, ntris)
+    return dist.min(axis=1), dist
+
+
+def test_closest():
+    a, b, c = np.eye(3)[None, 0], np.eye(3)[None, 1], np.eye(3)[None, 2]
+
+    # Vertex, edge, and face regions
+    points = np.array([[2.0, 0, 0], [1, 1, -1], [1, 1, 1]])
+    expected = np.array([[1.0, 0, 0], [0.5, 0.5, 0], [1 / 3, 1 / 3, 1 / 3]])
+
+    closest = bvh._closest(points, *[np.repeat(v, 3, axis=0) for v in (a, b, c)])
+    assert np.allclose(closest, expected)
+
+
+@pytest.mark.parametrize("fname", ["silo.stl", "valve.stl"])
+def test_query(fname):
+    vertices, faces = stl.read(os.path.join(MESH, fname))
+    tree = bvh.TriangleBVH(vertices, faces, leafSize=4)
+
+    rng = np.random.default_rng(0)
+    lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+    points = rng.uniform(lo - 0.2 * (hi - lo), hi + 0.2 * (hi - lo), size=(200, 3))
+
+    distance, triangle = tree.query(points)
+    expected, dist = brute(points, vertices, faces)
+
+    assert np.allclose(distance, expected)
+    assert np.allclose(dist[np.arange(len(points)), triangle], expected)
+
+
+def test_update():
+    vertices, faces = stl.read(os.path.join(MESH, "valve.stl"))
+    tree = bvh.TriangleBVH(vertices, faces)
+
+    rng = np.random.default_rng(1)
+    points = rng.uniform(vertices.min(axis=0), vertices.max(axis=0), size=(100, 3))
+    distance, triangle = tree.query(points)
+
+    assert not tree.update(vertices)
+
+    # Moving the mesh and the points together leaves distances unchanged
+    move = (0.5, -1.0, 2.0)
+    assert tree.update(stl.transform(vertices, move=move))
+
+    moved, _ = tree.query(points + move)
+    assert np.allclose(moved, distance)
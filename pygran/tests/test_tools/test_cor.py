@@ -0,0 +1,44 @@
+import os
+
+import numpy as np
+import pytest
+
+from pygran.params import glass
+from pygran.tools import cor
+
+
+class Linear:
+    """Stub contact model whose COR decreases linearly with the impact velocity and radius"""
+
+    def __init__(self, material):
+        self.material = material
+
+    def displacement(self):
+        vel = self.material["characteristicVelocity"]
+        cor = 1 - 0.1 * vel - self.material["radius"]
+
+        time = np.linspace(0, 1, 3)
+        disp = np.array([[0, -vel], [0, 0], [0, cor * vel]])
+
+        return time, disp, np.zeros(3)
+
+
+def test_cor_map(tmp_path, monkeypatch):
+    grid = {"characteristicVelocity": [1.0, 2.0, 3.0], "radius": [0.1, 0.2]}
+    interp = cor.cor_map(Linear, glass, grid, workers=2, cache=str(tmp_path))
+
+    assert interp([2.0, 0.1]) == pytest.approx(0.7)
+    assert interp([2.5, 0.15]) == pytest.approx(0.6)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # Cached maps are not recomputed
+    def fail(*args, **kwargs):
+        raise AssertionError("COR map was recomputed")
+
+    monkeypatch.setattr(cor, "ProcessPoolExecutor", fail)
+    cached = cor.cor_map(Linear, glass, grid, cache=str(tmp_path))
+    assert np.allclose(cached.values, interp.values)
+
+    # A different material or grid is a different map
+    with pytest.raises(AssertionError):
+        cor.cor_map(Linear, dict(glass, density=1), grid, cache=str(tmp_path))
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pygran.tools import mixing
+
+
+def particles(segregated, n=20000, seed=0):
+    # Binary system in a unit cube, either randomly mixed or split at x = 0.5
+    rng = np.random.default_rng(seed)
+    x, y, z = rng.random((3, n))
+    if segregated:
+        types = np.where(x < 0.5, 1, 2)
+    else:
+        types = rng.integers(1, 3, n)
+
+    return SimpleNamespace(x=x, y=y, z=z, type=types)
+
+
+def test_lacey():
+    bounds = (0, 1, 0, 1, 0, 1)
+
+    assert mixing.lacey(particles(False), bins=4, bounds=bounds) == pytest.approx(1, abs=0.1)
+    assert mixing.lacey(particles(True), bins=4, bounds=bounds) == pytest.approx(0, abs=0.05)
+
+
+def test_neighbor_index():
+    assert mixing.neighborIndex(particles(False)) == pytest.approx(1, abs=0.05)
+    assert mixing.neighborIndex(particles(True)) < 0.1
+
+
+def test_series():
+    frames = [particles(True), particles(False)]
+    values = mixing.series(frames, bins=4)
+
+    assert values.shape == (2,)
+    assert values[0] < values[1]
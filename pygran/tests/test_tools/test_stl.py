@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pytest
+
+from pygran.tools import stl
+
+MESH = os.path.join(os.path.dirname(__file__), "..", "test_sim", "mesh")
+
+
+@pytest.mark.parametrize("fname", ["silo.stl", "valve.stl"])
+def test_read(fname):
+    vertices, faces = stl.read(os.path.join(MESH, fname))
+
+    with open(os.path.join(MESH, fname)) as fp:
+        nfacets = sum(line.split()[0] == "facet" for line in fp if line.strip())
+
+    assert faces.shape == (nfacets, 3)
+    assert faces.max() == len(vertices) - 1
+
+    # Shared vertices are merged
+    assert len(vertices) < 3 * nfacets
+    assert len(np.unique(vertices, axis=0)) == len(vertices)
+
+
+def test_binary(tmp_path):
+    vertices, faces = stl.read(os.path.join(MESH, "valve.stl"))
+
+    records = np.zeros(len(faces), dtype=stl._RECORD)
+    records["vertices"] = vertices[faces]
+
+    fname = str(tmp_path / "valve.stl")
+    with open(fname, "wb") as fp:
+        fp.write(b"solid binary".ljust(80))
+        fp.write(np.uint32(len(faces)).tobytes())
+        fp.write(records.tobytes())
+
+    bvertices, bfaces = stl.read(fname)
+
+    # Vertices are stored as single precision in binary files
+    assert np.allclose(bvertices[bfaces], vertices[faces], rtol=1e-6)
+
+
+def test_transform():
+    vertices = np.array([[1.0, 0, 0], [0, 1.0, 0]])
+
+    moved = stl.transform(vertices, scale=2, move=(0, 0, 1))
+    assert np.allclose(moved, [[2, 0, 1], [0, 2, 1]])
+
+    # Keyword order matters
+    scaled = stl.transform(vertices, move=(0, 0, 1), scale=2)
+    assert np.allclose(scaled, [[2, 0, 2], [0, 2, 2]])
+
+    rotated = stl.transform(vertices, rotate=("axis", 0, 0, 1, "angle", 90))
+    assert np.allclose(rotated, [[0, 1, 0], [-1, 0, 0]])
+
+
+def test_load():
+    fname = os.path.join(MESH, "valve.stl")
+    vertices, faces = stl.load(fname, move=(0, 0, 1), scale=1e-3)
+
+    assert stl.load(fname, move=(0, 0, 1), scale=1e-3)[0] is vertices
+    assert stl.load(fname, scale=1e-3)[0] is not vertices
+    assert not vertices.flags.writeable
+
+    expected = stl.transform(stl.read(fname)[0], move=(0, 0, 1), scale=1e-3)
+    assert np.allclose(vertices, expected)
@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pytest
+
+from pygran import params, sweep
+
+
+def run(**args):
+    # Stub for a DEM run: writes a monitor file in its output dir like sim.monitor would
+    output = args.get("output", "out-stub")
+    os.makedirs(output)
+    data = np.array([[100, args["material"]["coefficientRestitution"] * args["scale"]]])
+    np.savetxt(os.path.join(output, "ke.dat"), data, header="TimeStep c_ke")
+
+
+def fail(**args):
+    raise RuntimeError("completed members must not be rerun")
+
+
+def test_sweep(tmp_path):
+    materials = [dict(params.organic, coefficientRestitution=cor) for cor in (0.5, 0.9)]
+    grid = {"material": materials, "scale": [1.0, 2.0]}
+    output = str(tmp_path / "sweep")
+
+    results = sweep(run, grid, workers=2, output=output, monitors=("ke.dat",))
+
+    assert len(results) == 4
+    assert len(set(results["path"])) == 4
+    for record in results:
+        expected = record["material"]["coefficientRestitution"] * record["scale"]
+        assert record["ke"][0, 1] == pytest.approx(expected)
+
+    # All members are cached, so nothing should run again
+    cached = sweep(fail, grid, output=output, monitors=("ke.dat",))
+    assert list(cached["path"]) == list(results["path"])
+
+    # A new member is not cached and must run
+    with pytest.raises(RuntimeError):
+        sweep(fail, {"material": materials[:1], "scale": [3.0]}, output=output)
+
+
+def test_output_key(tmp_path):
+    grid = {"material": [params.organic], "scale": [1.0]}
+    output = str(tmp_path / "sweep")
+
+    # run_fn gets no output arg unless asked for
+    results = sweep(run, grid, workers=1, output=output)
+    assert os.path.isdir(os.path.join(results["path"][0], "out-stub"))
+
+    results = sweep(run, grid, workers=1, output=output, output_key="output")
+    assert os.path.isdir(os.path.join(results["path"][0], "output"))
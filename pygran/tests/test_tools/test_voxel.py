@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pygran.tools import voxel
+
+
+def particles():
+    # Two non-overlapping spheres
+    return SimpleNamespace(
+        x=np.array([0.0, 3.0]),
+        y=np.array([0.0, 0.5]),
+        z=np.array([0.0, -0.5]),
+        radius=np.array([1.0, 0.5]),
+    )
+
+
+def test_volume():
+    resol = 0.1
+    volume = voxel.voxelize(particles(), resol)
+
+    expected = 4.0 / 3.0 * np.pi * (1.0 + 0.5**3)
+    assert volume.sum() * resol**3 == pytest.approx(expected, rel=0.02)
+    assert volume.min() >= 0 and volume.max() == 1
+
+
+def test_slabs(tmp_path, monkeypatch):
+    # Small slabs, multiple cores, and a memory-mapped output must give the same volume
+    resol = 0.1
+    volume = voxel.voxelize(particles(), resol)
+
+    monkeypatch.setattr(voxel, "_SLAB_BYTES", 4 * volume.shape[1] * volume.shape[2] * 3)
+    output = str(tmp_path / "volume.dat")
+    mapped = voxel.voxelize(particles(), resol, output=output, chunk=1000, ncores=2)
+
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(volume, mapped)
+    assert np.array_equal(volume, np.memmap(output, dtype=np.float32, shape=volume.shape))
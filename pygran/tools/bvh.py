@@ -0,0 +1,246 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+import numpy as np
+
+
+def _closest(points, a, b, c):
+    """Returns the closest points on triangles (a, b, c) to points, all (K, 3) arrays. Uses
+    the Voronoi regions of Ericson's 'Real-Time Collision Detection' (sec. 5.1.5), where the
+    first matching region wins, so regions are assigned here in reverse order."""
+
+    def dot(u, v):
+        return np.einsum("ij,ij->i", u, v)[:, None]
+
+    ab, ac = b - a, c - a
+    ap, bp, cp = points - a, points - b, points - c
+
+    d1, d2 = dot(ab, ap), dot(ac, ap)
+    d3, d4 = dot(ab, bp), dot(ac, bp)
+    d5, d6 = dot(ab, cp), dot(ac, cp)
+
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = va + vb + vc
+        closest = a + ab * (vb / denom) + ac * (vc / denom)
+
+        edge = (d4 - d3) + (d5 - d6)
+        mask = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        closest = np.where(mask, b + (c - b) * ((d4 - d3) / edge), closest)
+
+        mask = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        closest = np.where(mask, a + ac * (d2 / (d2 - d6)), closest)
+
+        closest = np.where((d6 >= 0) & (d5 <= d6), c, closest)
+
+        mask = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        closest = np.where(mask, a + ab * (d1 / (d1 - d3)), closest)
+
+    closest = np.where((d3 >= 0) & (d4 <= d3), b, closest)
+    closest = np.where((d1 <= 0) & (d2 <= 0), a, closest)
+
+    return closest
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy of axis-aligned boxes over the triangles of a surface mesh
+    (e.g. read with pygran.tools.stl), for batch nearest-triangle queries of many points
+    such as particle positions in every trajectory frame.
+
+    :param vertices: (M, 3) array of mesh vertices
+    :type vertices: ndarray
+
+    :param faces: (N, 3) array of vertex indices of each triangle
+    :type faces: ndarray
+
+    :param leafSize: max number of triangles in a leaf node
+    :type leafSize: int
+    """
+
+    def __init__(self, vertices, faces, leafSize=8):
+        self.faces = np.asarray(faces, dtype=int)
+        self.vertices = np.array(vertices, dtype=float)
+        self.leafSize = leafSize
+
+        self._build()
+
+    def _build(self):
+        """Builds the tree top-down by splitting triangles about the median centroid along the
+        longest axis of each node. Children are always numbered after their parent."""
+        centroids = self.vertices[self.faces].mean(axis=1)
+        self._order = np.arange(len(self.faces))
+
+        # Per node: children (-1 for a leaf) and range of triangles in self._order
+        left, right, start, end = [-1], [-1], [0], [len(self.faces)]
+        stack = [0]
+
+        while stack:
+            node = stack.pop()
+            i0, i1 = start[node], end[node]
+
+            if i1 - i0 <= self.leafSize:
+                continue
+
+            index = self._order[i0:i1]
+            axis = int(np.argmax(np.ptp(centroids[index], axis=0)))
+
+            mid = (i1 - i0) // 2
+            self._order[i0:i1] = index[np.argpartition(centroids[index, axis], mid)]
+
+            for bounds in ((i0, i0 + mid), (i0 + mid, i1)):
+                stack.append(len(start))
+                left.append(-1)
+                right.append(-1)
+                start.append(bounds[0])
+                end.append(bounds[1])
+
+            left[node], right[node] = stack[-2], stack[-1]
+
+        self._left = np.array(left)
+        self._right = np.array(right)
+        self._start = np.array(start)
+        self._end = np.array(end)
+
+        self._refit()
+
+    def _refit(self):
+        """Recomputes node boxes bottom-up for the current vertices, keeping the tree topology"""
+        triangles = self.vertices[self.faces[self._order]]
+        tlo, thi = triangles.min(axis=1), triangles.max(axis=1)
+
+        nnodes = len(self._left)
+        self._lo = np.empty((nnodes, 3))
+        self._hi = np.empty((nnodes, 3))
+
+        leaves = np.flatnonzero(self._left < 0)
+        for node in leaves:
+            i0, i1 = self._start[node], self._end[node]
+            self._lo[node] = tlo[i0:i1].min(axis=0)
+            self._hi[node] = thi[i0:i1].max(axis=0)
+
+        # Children come after their parent, so a reverse sweep visits children first
+        for node in np.flatnonzero(self._left >= 0)[::-1]:
+            children = [self._left[node], self._right[node]]
+            self._lo[node] = self._lo[children].min(axis=0)
+            self._hi[node] = self._hi[children].max(axis=0)
+
+    def update(self, vertices):
+        """Updates the mesh vertices (e.g. of a moving wall) for the same faces. Node boxes are
+        refit only if the vertices have changed, so this is cheap to call for every frame.
+
+        :param vertices: (M, 3) array of mesh vertices
+        :type vertices: ndarray
+
+        :return: True if the mesh has moved and boxes were refit
+        :rtype: bool
+        """
+        vertices = np.asarray(vertices, dtype=float)
+
+        if vertices.shape != self.vertices.shape:
+            raise ValueError("Vertices do not match the mesh faces; create a new TriangleBVH")
+
+        if np.array_equal(vertices, self.vertices):
+            return False
+
+        self.vertices = vertices.copy()
+        self._refit()
+
+        return True
+
+    def query(self, points):
+        """Finds the nearest triangle to each point. All points descend the tree together:
+        (point, node) pairs are pruned when the distance to the node box exceeds an upper bound
+        on the point's nearest distance, and exact point-triangle distances are computed only
+        for the remaining leaves.
+
+        :param points: (K, 3) array of points, e.g. particle positions
+        :type points: ndarray
+
+        :return: (distance, triangle) arrays of the nearest distance and triangle (row in faces)
+        :rtype: tuple
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        npts = len(points)
+
+        distance = np.full(npts, np.inf)
+        triangle = np.full(npts, -1)
+
+        # Squared upper bound on the nearest distance of each point
+        bound = np.full(npts, np.inf)
+
+        pts = np.arange(npts)
+        nodes = np.zeros(npts, dtype=int)
+
+        while len(pts):
+            lo, hi, xyz = self._lo[nodes], self._hi[nodes], points[pts]
+
+            # Box distance bounds any triangle in the node from below, and the farthest box
+            # corner bounds the nearest triangle in the node from above
+            lower = (np.maximum(np.maximum(lo - xyz, xyz - hi), 0) ** 2).sum(axis=1)
+            upper = (np.maximum(abs(xyz - lo), abs(xyz - hi)) ** 2).sum(axis=1)
+            np.minimum.at(bound, pts, upper)
+
+            keep = lower <= bound[pts] * (1 + 1e-12)
+            pts, nodes = pts[keep], nodes[keep]
+
+            leaf = self._left[nodes] < 0
+            self._leaves(points, pts[leaf], nodes[leaf], distance, triangle)
+            np.minimum.at(bound, pts[leaf], distance[pts[leaf]] ** 2)
+
+            pts, nodes = pts[~leaf], nodes[~leaf]
+            pts = np.concatenate([pts, pts])
+            nodes = np.concatenate([self._left[nodes], self._right[nodes]])
+
+        return distance, triangle
+
+    def _leaves(self, points, pts, nodes, distance, triangle):
+        """Computes exact distances between points and the triangles in their leaf nodes, and
+        updates the nearest distance and triangle of each point in-place"""
+        if not len(pts):
+            return
+
+        counts = self._end[nodes] - self._start[nodes]
+        pairs = np.repeat(pts, counts)
+
+        # Position of each pair in self._order
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        tris = self._order[np.repeat(self._start[nodes], counts) + offset]
+
+        a, b, c = np.moveaxis(self.vertices[self.faces[tris]], 1, 0)
+        dist = np.linalg.norm(points[pairs] - _closest(points[pairs], a, b, c), axis=1)
+
+        # Nearest pair per point: sort by point, then distance, and take the first of each point
+        index = np.lexsort((dist, pairs))
+        first = index[np.r_[True, pairs[index][1:] != pairs[index][:-1]]]
+
+        better = dist[first] < distance[pairs[first]]
+        distance[pairs[first][better]] = dist[first][better]
+        triangle[pairs[first][better]] = tris[first][better]
@@ -0,0 +1,120 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Default dir of cached COR maps
+CACHE = os.path.join(os.path.expanduser("~"), ".cache", "pygran", "cor")
+
+
+def _hash(model, material, grid):
+    """Returns a hash identifying a model class, material, and grid"""
+    encoded = json.dumps(
+        {
+            "model": "{}.{}".format(model.__module__, model.__name__),
+            "material": dict(material),
+            "grid": [(key, [float(v) for v in values]) for key, values in grid.items()],
+        },
+        sort_keys=True,
+        default=repr,
+    ).encode()
+
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _cor(model, material):
+    """Integrates a single collision and returns its coefficient of restitution"""
+    time, disp, force = model(material=material).displacement()
+    return abs(disp[-1, 1] / material["characteristicVelocity"])
+
+
+def cor_map(model, material, grid, workers=None, cache=CACHE):
+    """Computes the coefficient of restitution (COR) of a contact model over a grid of material
+    parameters, e.g. impact velocity, yieldPress, cohesionEnergyDensity, and radius. Each grid
+    point is a single collision integrated with model.displacement() in a process pool.
+
+    Results are cached on disk for the model class, material, and grid, so later calls with
+    the same inputs only build the interpolator.
+
+    :param model: contact model class (e.g. simulation.models.ThorntonNing)
+    :type model: class
+
+    :param material: material (e.g. from pygran.params) whose values are overridden on the grid
+    :type material: dict
+
+    :param grid: dict mapping each material parameter to a 1D increasing array of values; the
+        impact velocity is 'characteristicVelocity'
+    :type grid: dict
+
+    :param workers: number of worker processes (defaults to the number of cores)
+    :type workers: int
+
+    :param cache: dir of cached COR maps, or None to disable caching
+    :type cache: str
+
+    :return: interpolator of the COR taking points ordered as the grid keys
+    :rtype: scipy.interpolate.RegularGridInterpolator
+    """
+    from scipy.interpolate import RegularGridInterpolator
+
+    axes = [np.asarray(values, dtype=float) for values in grid.values()]
+    fname = None
+
+    if cache is not None:
+        fname = os.path.join(cache, _hash(model, material, grid) + ".npy")
+
+    if fname and os.path.exists(fname):
+        values = np.load(fname)
+    else:
+        materials = [
+            dict(material, **dict(zip(grid, point))) for point in itertools.product(*axes)
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            values = np.fromiter(
+                executor.map(_cor, itertools.repeat(model), materials), dtype=float
+            )
+
+        values = values.reshape([len(axis) for axis in axes])
+
+        if fname:
+            os.makedirs(cache, exist_ok=True)
+
+            # Write to a temp file first so an interrupted write is never read back
+            tmp = "{}.{}.tmp".format(fname, os.getpid())
+            with open(tmp, "wb") as fp:
+                np.save(fp, values)
+            os.replace(tmp, fname)
+
+    return RegularGridInterpolator(axes, values)
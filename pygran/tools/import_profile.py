@@ -0,0 +1,196 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+
+  Import-time profiler for the pygran package
+
+  Each module is imported in a fresh interpreter started with '-X importtime', once with an
+  empty bytecode cache (cold) and then with the cache populated by the cold run (warm). The
+  cumulative import time is broken down by the heavy dependencies pygran may pull in.
+
+  Usage:
+      python -m pygran.tools.import_profile [--modules pygran pygran.params ...]
+          [--threshold pygran=0.1 ...] [--repeat 5]
+
+  The legacy submodules (pygran.analysis, pygran.simulation) import even when the package they
+  wrap is missing; such modules are reported as unavailable. The script exits with a non-zero
+  status when a module fails to import, when a module with a threshold is unavailable, or when
+  its warm import time exceeds its threshold (in seconds).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULES = ("pygran", "pygran.params", "pygran.analysis", "pygran.simulation")
+DEPENDENCIES = ("numpy", "scipy", "vtk", "mpi4py", "pygran_analysis", "pygran_sim")
+
+# Modules that only wrap another package, which may be uninstalled
+WRAPPED = {"pygran.analysis": "pygran_analysis", "pygran.simulation": "pygran_sim"}
+
+# Default warm import-time thresholds in seconds
+THRESHOLDS = {"pygran": 0.1, "pygran.params": 0.1}
+
+
+def _parse(stderr):
+    """Parses '-X importtime' output into a dict mapping each imported module to its cumulative
+    time (s). A module listed more than once (e.g. a submodule imported by its own parent package)
+    keeps its outermost entry, which includes the time spent importing its parents."""
+    times, levels = {}, {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        level = len(name) - len(name.lstrip())
+        name = name.strip()
+
+        if level < levels.get(name, float("inf")):
+            times[name], levels[name] = int(cumulative) * 1e-6, level
+
+    return times
+
+
+class Unavailable(ImportError):
+    """Raised when a module imports but the package it wraps (see WRAPPED) is missing"""
+
+
+def profile(module, pycache=None):
+    """Imports 'module' in a fresh interpreter and returns a dict of cumulative import times (s)
+    for the module itself (key 'total') and for each of the DEPENDENCIES it loaded.
+
+    :param module: fully qualified module name
+    :type module: str
+
+    :param pycache: bytecode cache dir (see -X pycache_prefix); an empty dir yields a cold import
+    :type pycache: str
+
+    :raises Unavailable: if the package wrapped by 'module' is not installed
+    """
+    cmd = [sys.executable, "-X", "importtime"]
+
+    if pycache:
+        cmd += ["-X", f"pycache_prefix={pycache}"]
+
+    # PYTHONDONTWRITEBYTECODE would prevent the cold run from populating the cache for warm runs
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+
+    # '-X importtime' also lists failed imports (e.g. of optional dependencies), so the child
+    # reports which dependencies actually ended up in sys.modules
+    code = (
+        f"import {module}; import sys; "
+        f"print(' '.join(dep for dep in {DEPENDENCIES!r} if sys.modules.get(dep)))"
+    )
+
+    proc = subprocess.run(
+        cmd + ["-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times = _parse(proc.stderr)
+    loaded = proc.stdout.split()
+
+    if module in WRAPPED and WRAPPED[module] not in loaded:
+        raise Unavailable(f"{WRAPPED[module]} is not installed")
+
+    breakdown = {"total": times[module]}
+
+    for dep in DEPENDENCIES:
+        if dep in loaded and dep in times:
+            breakdown[dep] = times[dep]
+
+    return breakdown
+
+
+def benchmark(module, repeat=5):
+    """Returns the cold and warm import-time breakdowns for 'module'. The warm breakdown
+    is the fastest of 'repeat' runs."""
+    with tempfile.TemporaryDirectory() as pycache:
+        cold = profile(module, pycache)
+        warm = min(
+            (profile(module, pycache) for _ in range(repeat)), key=lambda b: b["total"]
+        )
+
+    return cold, warm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures pygran import times")
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument(
+        "--threshold",
+        nargs="+",
+        default=[],
+        metavar="MODULE=SECONDS",
+        help="max warm import time per module",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    thresholds = dict(THRESHOLDS)
+    for item in args.threshold:
+        module, seconds = item.split("=")
+        thresholds[module] = float(seconds)
+
+    failed, slow = [], []
+
+    print(f"{'module':<20}{'cold (s)':>12}{'warm (s)':>12}  breakdown (warm)")
+
+    for module in args.modules:
+        try:
+            cold, warm = benchmark(module, args.repeat)
+        except subprocess.CalledProcessError as err:
+            error = err.stderr.strip().splitlines()[-1]
+            print(f"{module:<20}{'failed':>12}: {error}")
+            failed.append(module)
+            continue
+        except Unavailable as err:
+            print(f"{module:<20}{'unavailable':>12}: {err}")
+
+            # A threshold means the module is expected to be importable
+            if module in thresholds:
+                failed.append(module)
+            continue
+
+        deps = ", ".join(f"{dep}={warm[dep]:.3f}" for dep in DEPENDENCIES if dep in warm)
+        print(f"{module:<20}{cold['total']:>12.3f}{warm['total']:>12.3f}  {deps}")
+
+        if module in thresholds and warm["total"] > thresholds[module]:
+            slow.append(module)
+
+    for module in slow:
+        print(f"{module} import time exceeds threshold of {thresholds[module]} s")
+
+    return 1 if failed or slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+import numpy as np
+
+
+def _positions(Particles):
+    """Returns an (N, 3) array of particle positions"""
+    return np.column_stack(
+        [np.asarray(Particles.x), np.asarray(Particles.y), np.asarray(Particles.z)]
+    )
+
+
+def _cells(pos, bins, bounds):
+    """Maps particle positions to flat cell indices of a regular grid, and returns them
+    with the total number of cells"""
+    bins = np.broadcast_to(np.asarray(bins, dtype=int), (3,))
+
+    if bounds is None:
+        lo, hi = pos.min(axis=0), pos.max(axis=0)
+    else:
+        lo, hi = np.asarray(bounds, dtype=float).reshape(3, 2).T
+
+    # Particles on the upper boundary belong to the last cell
+    index = np.floor((pos - lo) / (hi - lo) * bins).astype(int)
+    index = np.clip(index, 0, bins - 1)
+
+    return np.ravel_multi_index(index.T, bins), int(np.prod(bins))
+
+
+def lacey(Particles, species=1, bins=10, bounds=None, minCount=2, key="type"):
+    """Computes the Lacey mixing index of one species on a regular grid of cells (samples).
+    The index is 0 for a fully segregated system and 1 for a random mixture.
+
+    :param Particles: an object (e.g. analysis.Particles) with x, y, z, and species attributes
+    :type Particles: object
+
+    :param species: the species whose concentration is sampled
+    :type species: int
+
+    :param bins: number of cells along each axis
+    :type bins: int or tuple
+
+    :param bounds: (xmin, xmax, ymin, ymax, zmin, zmax) of the grid; defaults to the particle bounds
+    :type bounds: tuple
+
+    :param minCount: cells with fewer particles are not used as samples
+    :type minCount: int
+
+    :param key: name of the species attribute
+    :type key: str
+
+    :return: Lacey mixing index
+    :rtype: float
+    """
+    cells, ncells = _cells(_positions(Particles), bins, bounds)
+    isSpecies = np.asarray(getattr(Particles, key)) == species
+
+    count = np.bincount(cells, minlength=ncells)
+    countSpecies = np.bincount(cells, weights=isSpecies, minlength=ncells)
+
+    sampled = count >= minCount
+    if sampled.sum() < 2:
+        raise ValueError("At least 2 cells with minCount particles are required.")
+
+    frac = countSpecies[sampled] / count[sampled]
+    prob = isSpecies.mean()
+
+    var = ((frac - prob) ** 2).sum() / (sampled.sum() - 1)
+    var0 = prob * (1.0 - prob)
+    varR = var0 / count[sampled].mean()
+
+    return (var0 - var) / (var0 - varR)
+
+
+def neighborIndex(Particles, k=6, key="type"):
+    """Computes a nearest-neighbor mixing index: the mean fraction of the k nearest neighbors
+    that belong to a different species, normalized by its value for a random mixture. The index
+    is 0 for a fully segregated system and ~1 for a random mixture.
+
+    :param Particles: an object (e.g. analysis.Particles) with x, y, z, and species attributes
+    :type Particles: object
+
+    :param k: number of nearest neighbors per particle
+    :type k: int
+
+    :param key: name of the species attribute
+    :type key: str
+
+    :return: nearest-neighbor mixing index
+    :rtype: float
+    """
+    from scipy.spatial import cKDTree
+
+    pos = _positions(Particles)
+    types = np.asarray(getattr(Particles, key))
+
+    # The 1st neighbor of each particle is itself
+    _, neighs = cKDTree(pos).query(pos, k=k + 1)
+    unlike = (types[neighs[:, 1:]] != types[:, None]).mean(axis=1)
+
+    # In a random mixture, a neighbor differs with the probability of picking another species
+    _, inverse, counts = np.unique(types, return_inverse=True, return_counts=True)
+    expected = 1.0 - counts[inverse] / len(types)
+
+    return unlike.mean() / expected.mean()
+
+
+def series(frames, index=lacey, **kwargs):
+    """Computes a mixing index for each frame of a trajectory.
+
+    :param frames: an iterable of Particles, e.g. (System.Particles for _ in System)
+    :type frames: iterable
+
+    :param index: the mixing index function (lacey or neighborIndex)
+    :type index: callable
+
+    :param kwargs: keyword args passed to 'index'
+
+    :return: the mixing index time series
+    :rtype: numpy array
+    """
+    return np.fromiter((index(Particles, **kwargs) for Particles in frames), dtype=float)
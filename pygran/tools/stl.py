@@ -0,0 +1,164 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+import hashlib
+
+import numpy as np
+
+# STL binary layout: 80-byte header, uint32 triangle count, then one record per triangle
+_HEADER = 80
+_RECORD = np.dtype(
+    [("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attr", "<u2")]
+)
+
+# Loaded meshes keyed on (sha1 of file, transformation)
+_cache = {}
+
+
+def _isBinary(data):
+    """Checks if raw STL data is binary from its size (ASCII files may also start with 'solid')"""
+    if len(data) < _HEADER + 4:
+        return False
+
+    count = int(np.frombuffer(data, dtype="<u4", count=1, offset=_HEADER)[0])
+    return len(data) == _HEADER + 4 + count * _RECORD.itemsize
+
+
+def _triangles(data):
+    """Returns an (N, 3, 3) array of triangle vertices from raw STL data"""
+    if _isBinary(data):
+        records = np.frombuffer(data, dtype=_RECORD, offset=_HEADER + 4)
+        return records["vertices"].astype(float)
+
+    tokens = np.array(data.decode("ascii", errors="replace").split())
+    index = np.flatnonzero(tokens == "vertex")
+
+    if len(index) % 3:
+        raise ValueError("Incomplete facet in ASCII STL data")
+
+    coords = tokens[index[:, None] + np.arange(1, 4)].astype(float)
+    return coords.reshape(-1, 3, 3)
+
+
+def read(path):
+    """Reads a binary or ASCII STL file. Vertices shared by several facets are merged.
+
+    :param path: STL filename
+    :type path: str
+
+    :return: (vertices, faces) as an (M, 3) float array and an (N, 3) int array of vertex indices
+    :rtype: tuple
+    """
+    with open(path, "rb") as fp:
+        triangles = _triangles(fp.read())
+
+    vertices, faces = np.unique(triangles.reshape(-1, 3), axis=0, return_inverse=True)
+    return vertices, faces.reshape(-1, 3)
+
+
+def _rotation(axis, angle):
+    """Returns the matrix rotating by angle (in degrees) about axis (Rodrigues' formula)"""
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+    angle = np.radians(angle)
+
+    cross = np.array(
+        [
+            [0, -axis[2], axis[1]],
+            [axis[2], 0, -axis[0]],
+            [-axis[1], axis[0], 0],
+        ]
+    )
+
+    return np.eye(3) + np.sin(angle) * cross + (1 - np.cos(angle)) * cross @ cross
+
+
+def transform(vertices, **args):
+    """Transforms mesh vertices the way LIGGGHTS does when importing a mesh, i.e. for the
+    same 'args' passed to a mesh in DEM. Transformations are applied in keyword order, and
+    keywords other than the ones listed below (e.g. 'curvature') are ignored.
+
+    :param vertices: (M, 3) array of vertices
+    :type vertices: ndarray
+
+    :param scale: factor to scale vertices with
+    :type scale: float
+
+    :param move: (dx, dy, dz) displacement
+    :type move: tuple
+
+    :param rotate: rotation as ('axis', ax, ay, az, 'angle', degrees) or (ax, ay, az, degrees)
+    :type rotate: tuple
+
+    :return: (M, 3) array of transformed vertices
+    :rtype: ndarray
+    """
+    vertices = np.array(vertices, dtype=float)
+
+    for key, value in args.items():
+        if key == "scale":
+            vertices *= float(value)
+        elif key == "move":
+            vertices += np.asarray(value, dtype=float)
+        elif key == "rotate":
+            value = [item for item in value if not isinstance(item, str)]
+
+            if len(value) != 4:
+                raise ValueError("rotate must specify an axis (3 components) and an angle")
+
+            vertices = vertices @ _rotation(value[:3], value[3]).T
+
+    return vertices
+
+
+def load(path, **args):
+    """Reads and transforms (see transform) an STL file. Results are cached on the file
+    content and transformation, so loading the same mesh again (e.g. for every trajectory
+    frame) is free. The returned arrays are read-only since they are shared.
+
+    :param path: STL filename
+    :type path: str
+
+    :return: (vertices, faces) arrays
+    :rtype: tuple
+    """
+    with open(path, "rb") as fp:
+        digest = hashlib.sha1(fp.read()).hexdigest()
+
+    key = (digest, repr(list(args.items())))
+
+    if key not in _cache:
+        vertices, faces = read(path)
+        vertices = transform(vertices, **args)
+
+        for array in (vertices, faces):
+            array.setflags(write=False)
+
+        _cache[key] = vertices, faces
+
+    return _cache[key]
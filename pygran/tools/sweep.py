@@ -0,0 +1,169 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+import glob
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Marker file written in a member dir once its run has completed
+_DONE = "params.json"
+
+
+def _hash(params):
+    """Returns a short hash identifying a parameter set (materials and tuples included)"""
+    encoded = json.dumps(params, sort_keys=True, default=repr).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def _members(param_grid, base):
+    """Expands a param grid (dict of lists or list of dicts) into a list of parameter sets"""
+    if isinstance(param_grid, dict):
+        keys = list(param_grid)
+        values = itertools.product(*param_grid.values())
+        grid = [dict(zip(keys, value)) for value in values]
+    else:
+        grid = [dict(member) for member in param_grid]
+
+    return [dict(base or {}, **member) for member in grid], grid
+
+
+def _run(run_fn, params, path):
+    """Runs a single member in its own dir, and marks it as completed on success"""
+    cwd = os.getcwd()
+    os.makedirs(path, exist_ok=True)
+    os.chdir(path)
+
+    try:
+        run_fn(**params)
+    finally:
+        os.chdir(cwd)
+
+    with open(os.path.join(path, _DONE), "w") as fp:
+        json.dump(params, fp, sort_keys=True, default=repr)
+
+
+def _readMonitor(path, fname):
+    """Reads a monitor file (e.g. written by fix ave/time) from a member dir, or returns None"""
+    files = glob.glob(os.path.join(path, "**", fname), recursive=True)
+
+    if not files:
+        return None
+
+    return np.loadtxt(files[0], comments="#", ndmin=2)
+
+
+def sweep(
+    run_fn,
+    param_grid,
+    workers=None,
+    output="sweep",
+    base=None,
+    monitors=(),
+    output_key=None,
+):
+    """Runs a parameter sweep with each member in a separate process on the local machine.
+
+    Each member is run with its own directory 'output/<hash>' as the working directory, where
+    the hash identifies its parameter set. A simulation.DEM created by run_fn therefore writes
+    its (timestamped by default) output dir inside the member dir. Members whose directory already holds a completed run are skipped, so an
+    interrupted or extended sweep only computes what is missing.
+
+    :param run_fn: function (picklable, i.e. defined at module level) that runs a single
+        member, e.g. by creating a simulation.DEM from its keyword arguments
+    :type run_fn: callable
+
+    :param param_grid: values to sweep, either a dict mapping each parameter to a list of values
+        (all combinations are run) or a list of dicts (one per member)
+    :type param_grid: dict or list
+
+    :param workers: number of worker processes (defaults to the number of cores)
+    :type workers: int
+
+    :param output: root dir in which member dirs are created
+    :type output: str
+
+    :param base: parameters shared by all members, overridden by the grid values
+    :type base: dict
+
+    :param monitors: monitor file names (e.g. 'ke.dat' passed to sim.monitor) to collect
+    :type monitors: sequence of str
+
+    :param output_key: if set, the parameter of this name is set to 'output' for every member,
+        e.g. output_key='output' makes each DEM write to 'output' inside its member dir
+    :type output_key: str
+
+    :return: a structured array with one record per member. Fields: 'path' (member dir), one
+        field per swept parameter, and one field per monitor (named after the file without
+        its extension), which holds the parsed monitor array or None.
+    :rtype: numpy.ndarray
+    """
+    members, grid = _members(param_grid, base)
+    output = os.path.abspath(output)
+
+    if output_key is not None:
+        for params in members:
+            params[output_key] = "output"
+
+    paths = [os.path.join(output, _hash(params)) for params in members]
+
+    pending = [
+        (params, path)
+        for params, path in zip(members, paths)
+        if not os.path.exists(os.path.join(path, _DONE))
+    ]
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run, run_fn, params, path) for params, path in pending
+            ]
+
+            for future in futures:
+                future.result()
+
+    keys = list(dict.fromkeys(key for member in grid for key in member))
+    names = [os.path.splitext(os.path.basename(fname))[0] for fname in monitors]
+
+    dtype = [("path", object)] + [(field, object) for field in keys + names]
+    results = np.empty(len(members), dtype=dtype)
+
+    for record, member, path in zip(results, grid, paths):
+        record["path"] = path
+
+        for key in keys:
+            record[key] = member.get(key)
+
+        for name, fname in zip(names, monitors):
+            record[name] = _readMonitor(path, fname)
+
+    return results
@@ -0,0 +1,152 @@
+"""
+  Created on Oct 19, 2026
+  Author: Andrew Abi-Mansour
+
+  This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+  DEM simulation and analysis toolkit
+  http://www.pygran.org, support@pygran.org
+
+  Core developer and main author:
+  Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+  PyGran is open-source, distributed under the terms of the GNU Public
+  License, version 2 or later. It is distributed in the hope that it will
+  be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+  of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+  received a copy of the GNU General Public License along with PyGran.
+  If not, see http://www.gnu.org/licenses . See also top-level README
+  and LICENSE files.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Max size (in bytes) of a slab of voxels computed at once
+_SLAB_BYTES = 2**26
+
+
+def _fillSlab(pos, radius, lo, resol, shape, supersample, i0, i1, chunk):
+    """Computes the solid fraction of voxel layers [i0, i1) along the x-axis by sampling each
+    voxel at supersample^3 points"""
+    h = resol / supersample
+    size = (i1 - i0, shape[1], shape[2])
+    bounds = np.array([size[0], shape[1], shape[2]]) * supersample
+    first = np.array([i0 * supersample, 0, 0])
+
+    # Only particles that overlap the slab contribute to it
+    xmin, xmax = lo[0] + i0 * resol, lo[0] + i1 * resol
+    sel = (pos[:, 0] + radius > xmin) & (pos[:, 0] - radius < xmax)
+    pos, radius = pos[sel], radius[sel]
+
+    counts = np.zeros(np.prod(size))
+
+    # Width (in sample points) of the cube enclosing each sphere
+    width = np.ceil(2 * radius / h).astype(int) + 2
+
+    # Spheres of the same width share the same stencil of sample points, so they are
+    # processed together in batches of at most 'chunk' sample points
+    for m in np.unique(width):
+        offsets = np.indices((m, m, m)).reshape(3, -1).T
+        group = np.flatnonzero(width == m)
+        nbatch = max(1, chunk // len(offsets))
+
+        for start in range(0, len(group), nbatch):
+            batch = group[start : start + nbatch]
+            center, rad = pos[batch], radius[batch]
+
+            corner = np.floor((center - rad[:, None] - lo) / h).astype(int)
+            index = corner[:, None, :] + offsets[None, :, :]
+            points = lo + (index + 0.5) * h
+
+            inside = ((points - center[:, None, :]) ** 2).sum(axis=2) <= rad[:, None] ** 2
+            inside &= ((index >= first) & (index < first + bounds)).all(axis=2)
+
+            voxels = (index[inside] - first) // supersample
+            counts += np.bincount(
+                np.ravel_multi_index(voxels.T, size), minlength=counts.size
+            )
+
+    # Overlapping particles are sampled more than once, so cap the fraction at 1
+    frac = np.minimum(counts / supersample**3, 1.0)
+
+    return frac.reshape(size).astype(np.float32)
+
+
+def voxelize(
+    Particles, resol, bounds=None, supersample=4, output=None, chunk=2**22, ncores=None
+):
+    """Computes the solid fraction of each voxel of a 3D grid. The overlap of each voxel with the
+    particles is estimated by supersampling it at supersample^3 points. The grid is computed in
+    slabs along the x-axis, each slab in vectorized chunks, so grids larger than the available
+    RAM can be written directly to a memory-mapped file.
+
+    :param Particles: an object (e.g. analysis.Particles) with x, y, z, and radius attributes
+    :type Particles: object
+
+    :param resol: voxel size (in distance units)
+    :type resol: float
+
+    :param bounds: (xmin, xmax, ymin, ymax, zmin, zmax) of the grid; defaults to the particle bounds
+    :type bounds: tuple
+
+    :param supersample: number of sample points per voxel along each axis
+    :type supersample: int
+
+    :param output: filename of a memory-mapped (numpy.memmap) output array; if None, the volume is
+        returned as an in-memory array
+    :type output: str
+
+    :param chunk: max number of sample points evaluated at once (controls temporary memory)
+    :type chunk: int
+
+    :param ncores: number of processes computing slabs concurrently
+    :type ncores: int
+
+    :return: solid fraction (float32) of each voxel, indexed as [x, y, z]
+    :rtype: numpy array or numpy.memmap
+    """
+    pos = np.column_stack(
+        [np.asarray(Particles.x), np.asarray(Particles.y), np.asarray(Particles.z)]
+    ).astype(float)
+    radius = np.asarray(Particles.radius, dtype=float)
+
+    if bounds is None:
+        lo = (pos - radius[:, None]).min(axis=0)
+        hi = (pos + radius[:, None]).max(axis=0)
+    else:
+        lo, hi = np.asarray(bounds, dtype=float).reshape(3, 2).T
+
+    shape = tuple(int(n) for n in np.maximum(np.ceil((hi - lo) / resol), 1))
+
+    if output:
+        volume = np.memmap(output, dtype=np.float32, mode="w+", shape=shape)
+    else:
+        volume = np.zeros(shape, dtype=np.float32)
+
+    layers = max(1, _SLAB_BYTES // (4 * shape[1] * shape[2]))
+    slabs = [(i0, min(i0 + layers, shape[0])) for i0 in range(0, shape[0], layers)]
+    args = [
+        (pos, radius, lo, resol, shape, supersample, i0, i1, chunk) for i0, i1 in slabs
+    ]
+
+    if ncores and ncores > 1:
+        with ProcessPoolExecutor(max_workers=ncores) as executor:
+            for (i0, i1), slab in zip(slabs, executor.map(_fillSlab, *zip(*args))):
+                volume[i0:i1] = slab
+    else:
+        for (i0, i1), arg in zip(slabs, args):
+            volume[i0:i1] = _fillSlab(*arg)
+
+    if output:
+        volume.flush()
+
+    return volume
@@ -39,11 +39,14 @@ from distutils.command.clean import clean
 from distutils.command.install import install
 
 from setuptools import find_packages, setup
+from setuptools.command.egg_info import egg_info
 
 import versioneer
 
 short_description = __doc__.split("\n")
 
+STATIC_VERSION_FILE = os.path.join("pygran", "_static_version.py")
+
 try:
     with open("README.md", "r") as handle:
         long_description = handle.read()
@@ -151,9 +154,45 @@ class LIGGGHTS(Track):
         os.chdir(os.path.join("..", ".."))
 
 
+def write_static_version(filename):
+    """Bakes the versioneer version into a constant module so that pygran never probes git at runtime"""
+    versions = versioneer.get_versions()
+
+    with open(filename, "w") as fp:
+        fp.write(
+            "# This file is generated by setup.py at build/install time. Do not edit.\n"
+            f"version = {versions['version']!r}\n"
+            f"full_revisionid = {versions['full-revisionid']!r}\n"
+        )
+
+    print(f"set {filename} to '{versions['version']}'")
+
+
 cmdclass = versioneer.get_cmdclass()
 cmdclass["build_liggghts"] = LIGGGHTS
 
+_build_py = cmdclass["build_py"]
+
+
+class StaticVersionBuild(_build_py):
+    """Writes the static version module into the build directory"""
+
+    def run(self):
+        _build_py.run(self)
+        write_static_version(os.path.join(self.build_lib, STATIC_VERSION_FILE))
+
+
+class StaticVersionEggInfo(egg_info):
+    """Writes the static version module into the source tree (used by develop/editable installs)"""
+
+    def run(self):
+        write_static_version(STATIC_VERSION_FILE)
+        egg_info.run(self)
+
+
+cmdclass["build_py"] = StaticVersionBuild
+cmdclass["egg_info"] = StaticVersionEggInfo
+
 setup(
     name="pygran",
     author="Andrew Abi-Mansour",